@@ -9,13 +9,19 @@ and rename them according to standardized naming conventions.
 
 import os
 import sys
+import errno
 import argparse
-import requests
+import atexit
+from datetime import timedelta
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession, DO_NOT_CACHE
+from urllib3.util.retry import Retry
 import logging
-import re
 from pathlib import Path
+from collections import defaultdict
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 # Configure logging
 logging.basicConfig(
@@ -28,9 +34,160 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Translation table dropping characters that are invalid in filenames
+_TRANSLATE_DROP = {ord(c): None for c in '<>:"/\\|?*'}
+
+# Upper bound on concurrent metadata lookups (I/O-bound, so threads release the GIL)
+MAX_WORKERS = 16
+
+# Persistent HTTP cache so re-runs don't re-query titles already looked up
+CACHE_PATH = '.create_is_cache.sqlite'
+CACHE_EXPIRE_AFTER = timedelta(days=7)
+
+# Media file extensions picked up when scanning directories
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mkv', '.avi', '.mov'})
+# Common spellings (.mkv, .MKV, .Mkv) so most names match without lower();
+# every extension above is four characters including the dot
+_VIDEO_EXTENSION_VARIANTS = frozenset(
+    variant
+    for ext in VIDEO_EXTENSIONS
+    for variant in (ext, ext.upper(), '.' + ext[1:].capitalize())
+)
+
+# Number of aliased searches sent in a single AniList GraphQL request
+ANILIST_BATCH_SIZE = 25
+
+# Marks a title whose TMDB request failed, as opposed to one TMDB had no results for
+_LOOKUP_FAILED = object()
+
+# Delimiters allowed around a year in a filename, e.g. "Title.1999.", "Title (1999)"
+_YEAR_OPEN = '(.[ '
+_YEAR_CLOSE = ').] '
+_DIGITS = '0123456789'
+
+def _find_year(stem: str) -> Tuple[int, Optional[int]]:
+    """Find the right-most delimited 19xx/20xx year in a filename stem.
+    
+    Candidates are located with str.rfind rather than a regex scan.
+    
+    Args:
+        stem (str): The filename without extension
+        
+    Returns:
+        Tuple[int, Optional[int]]: Index of the year's first digit and the year, or (-1, None)
+    """
+    best = -1
+    for prefix in ('19', '20'):
+        # A year needs one delimiter before it and one after its four digits
+        i = stem.rfind(prefix, 1, len(stem) - 3)
+        while i > best:
+            if (stem[i - 1] in _YEAR_OPEN and stem[i + 4] in _YEAR_CLOSE
+                    and stem[i + 2] in _DIGITS and stem[i + 3] in _DIGITS):
+                best = i
+                break
+            i = stem.rfind(prefix, 1, i + 1)
+    
+    if best < 0:
+        return -1, None
+    return best, int(stem[best:best + 4])
+
+@lru_cache(maxsize=4096)
+def extract_title_year(filename: str) -> Tuple[str, Optional[int]]:
+    """Extract title and year from a filename.
+
+    Args:
+        filename (str): The filename to process
+
+    Returns:
+        Tuple[str, Optional[int]]: A tuple of (title, year) where year may be None
+    """
+    stem = Path(filename).stem
+    # Find 4-digit years in brackets, parens, or separated by dots
+    start, year = _find_year(stem)
+
+    if year is not None:
+        # Remove the year and its delimiters from the stem to get clean title
+        title = stem[:start - 1] + stem[start + 5:]
+        title = title.replace('.', ' ').strip()
+        return title, year
+
+    return stem.replace('.', ' ').strip(), None
+
+@lru_cache(maxsize=4096)
+def sanitize_filename(filename: str) -> str:
+    """Remove invalid characters from a filename.
+
+    Args:
+        filename (str): The filename to sanitize
+
+    Returns:
+        str: A sanitized version of the filename
+    """
+    return filename.translate(_TRANSLATE_DROP).strip()
+
+def rename_no_clobber(src: Union[str, Path], dst: Union[str, Path]):
+    """Rename a file without ever replacing an existing target.
+    
+    A hard link to the new name is created first, which fails atomically if the
+    target exists, and the old name is then removed. This closes the window
+    between an exists() check and rename(), where os.rename on POSIX would
+    silently overwrite. Filesystems without hard links fall back to a checked rename.
+    
+    Args:
+        src (Union[str, Path]): The file to rename
+        dst (Union[str, Path]): The new path
+        
+    Raises:
+        FileExistsError: If dst already exists
+    """
+    try:
+        os.link(src, dst, follow_symlinks=False)
+    except FileExistsError:
+        raise
+    except OSError:
+        # Hard links unsupported (FAT/exFAT, some SMB mounts)
+        if os.path.lexists(dst):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(dst))
+        os.rename(src, dst)
+        return
+    os.unlink(src)
+
+def iter_media_files(root: Union[str, Path], recursive: bool):
+    """Yield media files under a directory using os.scandir.
+    
+    Entries are filtered on their name before any Path object is built.
+    
+    Args:
+        root (Union[str, Path]): The directory to scan
+        recursive (bool): If True, descend into subdirectories
+        
+    Yields:
+        Path: Each media file found
+    """
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        yield from iter_media_files(entry.path, recursive)
+                elif entry.is_file():
+                    name = entry.name
+                    tail = name[-4:]
+                    if len(name) > 4 and (tail in _VIDEO_EXTENSION_VARIANTS
+                                          or tail.lower() in VIDEO_EXTENSIONS):
+                        yield Path(entry.path)
+    except OSError as e:
+        logger.error(f"Cannot scan directory {root}: {e}")
+
 class MediaOrganizer:
     """Handles media file organization using TMDB and AniList APIs."""
     
+    __slots__ = ('api_key', 'base_url', 'anilist_base_url', 'session', 'headers', 'cache')
+    
+    # Worker threads are shared by every organizer and process_directory call
+    # rather than started and torn down per directory
+    _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    
     def __init__(self, api_key: str = ""):
         """Initialize the Media Organizer with an API key for TMDB.
         
@@ -41,7 +198,24 @@ class MediaOrganizer:
         self.base_url = "https://api.themoviedb.org/3"
         self.anilist_base_url = "https://graphql.anilist.co"
         
-        self.session = requests.Session()
+        self.session = CachedSession(
+            CACHE_PATH,
+            backend='sqlite',
+            expire_after=CACHE_EXPIRE_AFTER,
+            allowable_methods=['GET', 'POST'],
+            match_headers=['Content-Type'],
+            # Artwork is written to disk anyway; keep images out of the cache
+            urls_expire_after={'image.tmdb.org': DO_NOT_CACHE}
+        )
+        # Keep-alive pool shared by TMDB, AniList and artwork downloads, with
+        # retries on rate limiting and transient server errors
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.headers['Accept-Encoding'] = 'gzip'
         if self.api_key:
             self.session.params = {'api_key': self.api_key}
             
@@ -49,7 +223,104 @@ class MediaOrganizer:
             'Content-Type': 'application/json',
             'User-Agent': 'CreateIs/1.0'
         }
-        self.cache = {}
+        # Search results keyed by (kind, title[, year]); see _cached()
+        self.cache: Dict[Tuple, Optional[Dict]] = {}
+
+    def _cached(self, key: Tuple, lookup: Callable[[], Optional[Dict]]) -> Optional[Dict]:
+        """Return a memoized search result, running the lookup on a miss.
+        
+        Results are memoized per instance on top of the persistent HTTP cache,
+        so repeated titles skip the SQLite lookup and JSON decoding entirely.
+        Only answered lookups are stored; a lookup that raises is retried on
+        the next call.
+        
+        Args:
+            key (Tuple): The cache key, e.g. ('movie', title, year)
+            lookup (Callable[[], Optional[Dict]]): Performs the search, raising on request failure
+            
+        Returns:
+            Optional[Dict]: The search result, or None if nothing was found
+        """
+        if key in self.cache:
+            return self.cache[key]
+        result = lookup()
+        self.cache[key] = result
+        return result
+
+    def _search_movie(self, title: str, year: Optional[int]) -> Optional[Dict]:
+        """Query TMDB /search/movie, raising on request failure."""
+        params = {'query': title}
+        if year:
+            params['release_year'] = str(year)
+            
+        response = self.session.get(f"{self.base_url}/search/movie", params=params)
+        response.raise_for_status()
+        
+        data = response.json()
+        if data.get('results'):
+            return data['results'][0]
+        return None
+
+    def _search_tv_show(self, title: str, year: Optional[int]) -> Optional[Dict]:
+        """Query TMDB /search/tv, raising on request failure."""
+        params = {'query': title}
+        if year:
+            params['first_air_date_year'] = str(year)
+            
+        response = self.session.get(f"{self.base_url}/search/tv", params=params)
+        response.raise_for_status()
+        
+        data = response.json()
+        if data.get('results'):
+            return data['results'][0]
+        return None
+
+    def _search_multi(self, title: str, year: Optional[int]) -> Optional[Dict]:
+        """Query TMDB /search/multi, raising on request failure."""
+        response = self.session.get(f"{self.base_url}/search/multi", params={'query': title})
+        response.raise_for_status()
+        
+        data = response.json()
+        # Multi search also returns people; only movies and shows are media
+        results = [r for r in data.get('results', []) if r.get('media_type') in ('movie', 'tv')]
+        if year:
+            for result in results:
+                date = result.get('release_date') or result.get('first_air_date') or ''
+                if date[:4] == str(year):
+                    return result
+        if results:
+            return results[0]
+        return None
+
+    def _search_anime(self, title: str) -> Optional[Dict]:
+        """Query AniList for a single anime, raising on request failure."""
+        query = """
+        query ($search: String) {
+            Page(perPage: 1) {
+                media(search: $search, type: ANIME) {
+                    id
+                    title { romaji english }
+                    startDate { year }
+                    coverImage { large }
+                    bannerImage
+                }
+            }
+        }
+        """
+        response = self.session.post(
+            self.anilist_base_url,
+            json={'query': query, 'variables': {'search': title}},
+            headers=self.headers,
+            params={'api_key': None}  # don't send the TMDB key to AniList
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        # AniList returns a list under Page -> media
+        media_list = data.get('data', {}).get('Page', {}).get('media', [])
+        if media_list:
+            return media_list[0]
+        return None
 
     def search_movie(self, title: str, year: Optional[int] = None) -> Optional[Dict]:
         """Search for a movie on TMDB by title and optional year.
@@ -61,23 +332,8 @@ class MediaOrganizer:
         Returns:
             Optional[Dict]: Movie information from TMDB or None if not found
         """
-        cache_key = f"movie_{title}_{year}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-            
         try:
-            params = {'query': title}
-            if year:
-                params['release_year'] = str(year)
-                
-            response = self.session.get(f"{self.base_url}/search/movie", params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            if data.get('results'):
-                result = data['results'][0]
-                self.cache[cache_key] = result
-                return result
+            return self._cached(('movie', title, year), lambda: self._search_movie(title, year))
         except Exception as e:
             logger.error(f"Error searching for movie '{title}': {e}")
         return None
@@ -92,27 +348,39 @@ class MediaOrganizer:
         Returns:
             Optional[Dict]: TV show information from TMDB or None if not found
         """
-        cache_key = f"tv_{title}_{year}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-            
         try:
-            params = {'query': title}
-            if year:
-                params['first_air_date_year'] = str(year)
-                
-            response = self.session.get(f"{self.base_url}/search/tv", params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            if data.get('results'):
-                result = data['results'][0]
-                self.cache[cache_key] = result
-                return result
+            return self._cached(('tv', title, year), lambda: self._search_tv_show(title, year))
         except Exception as e:
             logger.error(f"Error searching for TV show '{title}': {e}")
         return None
 
+    def search_multi(self, title: str, year: Optional[int] = None) -> Optional[Dict]:
+        """Search TMDB movies and TV shows in a single request.
+        
+        /search/multi has no year filter, so when a year is given the first
+        result released that year is preferred over the top result.
+        
+        Args:
+            title (str): The title to search for
+            year (Optional[int]): The release or first air year
+            
+        Returns:
+            Optional[Dict]: Movie or TV show information from TMDB, with
+            'media_type' set to 'movie' or 'tv', or None if not found
+        """
+        try:
+            return self._lookup_multi(title, year)
+        except Exception as e:
+            logger.error(f"Error searching for '{title}': {e}")
+        return None
+
+    def _lookup_multi(self, title: str, year: Optional[int]) -> Optional[Dict]:
+        """Memoized TMDB multi search that raises on request failure.
+        
+        Callers use this to tell an empty answer (None) from a failed request.
+        """
+        return self._cached(('multi', title, year), lambda: self._search_multi(title, year))
+
     def search_anime(self, title: str) -> Optional[Dict]:
         """Search for an anime on AniList by title.
         
@@ -122,79 +390,99 @@ class MediaOrganizer:
         Returns:
             Optional[Dict]: Anime information from AniList or None if not found
         """
-        cache_key = f"anime_{title}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-            
-        query = """
-        query ($search: String) {
-            Page(perPage: 1) {
-                media(search: $search, type: ANIME) {
-                    id
-                    title { romaji english }
-                    startDate { year }
-                    coverImage { large }
-                    bannerImage
-                }
-            }
-        }
-        """
         try:
-            response = self.session.post(
-                self.anilist_base_url,
-                json={'query': query, 'variables': {'search': title}},
-                headers=self.headers
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            # AniList returns a list under Page -> media
-            media_list = data.get('data', {}).get('Page', {}).get('media', [])
-            if media_list:
-                result = media_list[0]
-                self.cache[cache_key] = result
-                return result
+            return self._cached(('anime', title), lambda: self._search_anime(title))
         except Exception as e:
             logger.error(f"Error searching for anime '{title}': {e}")
         return None
 
-    def extract_title_year(self, filename: str) -> Tuple[str, Optional[int]]:
-        """Extract title and year from a filename using regex patterns.
+    def search_anime_batch(self, titles: List[str]) -> Dict[str, Optional[Dict]]:
+        """Search for several anime on AniList using aliased GraphQL queries.
+        
+        Up to ANILIST_BATCH_SIZE titles are looked up per request instead of
+        one request per title.
         
         Args:
-            filename (str): The filename to process
+            titles (List[str]): The anime titles to search for
             
         Returns:
-            Tuple[str, Optional[int]]: A tuple of (title, year) where year may be None
+            Dict[str, Optional[Dict]]: Anime information keyed by title, None where not found
         """
-        stem = Path(filename).stem
-        # Improved regex to find 4-digit years in brackets, parens, or separated by dots
-        year_pattern = r'[\(\.\[ ](19|20)\d{2}[\)\.\] ]'
-        match = re.search(year_pattern, stem)
-        
-        if match:
-            year_str = re.search(r'\d{4}', match.group()).group() # pyright: ignore[reportOptionalMemberAccess]
-            year = int(year_str)
-            # Fix: Extract title properly by excluding the matched year part
-            title_start = match.start()
-            title_end = match.end()
-            # Remove the matched year part from the stem to get clean title
-            title = stem[:title_start] + stem[title_end:]
-            title = title.replace('.', ' ').strip()
-            return title, year
-        
-        return stem.replace('.', ' ').strip(), None
-
-    def sanitize_filename(self, filename: str) -> str:
-        """Remove invalid characters from a filename.
+        unique = list(dict.fromkeys(titles))
+        results: Dict[str, Optional[Dict]] = dict.fromkeys(unique)
+        
+        for start in range(0, len(unique), ANILIST_BATCH_SIZE):
+            chunk = unique[start:start + ANILIST_BATCH_SIZE]
+            signature = ', '.join(f'$s{i}: String' for i in range(len(chunk)))
+            pages = '\n'.join(
+                f'a{i}: Page(perPage: 1) {{ media(search: $s{i}, type: ANIME) {{ '
+                f'id title {{ romaji english }} startDate {{ year }} coverImage {{ large }} bannerImage }} }}'
+                for i in range(len(chunk))
+            )
+            query = f"query ({signature}) {{\n{pages}\n}}"
+            variables = {f's{i}': title for i, title in enumerate(chunk)}
+            try:
+                response = self.session.post(
+                    self.anilist_base_url,
+                    json={'query': query, 'variables': variables},
+                    headers=self.headers,
+                    params={'api_key': None}  # don't send the TMDB key to AniList
+                )
+                response.raise_for_status()
+                data = response.json().get('data') or {}
+                
+                for i, title in enumerate(chunk):
+                    media_list = (data.get(f'a{i}') or {}).get('media', [])
+                    if media_list:
+                        results[title] = media_list[0]
+            except Exception as e:
+                logger.error(f"Error batch searching for {len(chunk)} anime: {e}")
+        return results
+
+    def identify(self, title: str, year: Optional[int] = None) -> Optional[Dict]:
+        """Identify a title as a movie, TV show or anime.
+        
+        TMDB is queried first; AniList is only consulted when TMDB answered
+        with no movie or TV results. If the TMDB request itself fails (bad
+        API key, timeout, retries exhausted) the title is left unmatched.
         
         Args:
-            filename (str): The filename to sanitize
+            title (str): The title to look up
+            year (Optional[int]): The release year, if known
             
         Returns:
-            str: A sanitized version of the filename
+            Optional[Dict]: Media information with 'media_type' set to 'movie',
+            'tv' or 'anime', or None if not found
         """
-        return re.sub(r'[<>:"/\\|?*]', '', filename).strip()
+        try:
+            media = self._lookup_multi(title, year)
+        except Exception as e:
+            logger.error(f"Error searching for '{title}': {e}")
+            return None
+        if media:
+            return media
+        anime = self.search_anime(title)
+        if anime:
+            return {**anime, 'media_type': 'anime'}
+        return None
+
+    def format_filename(self, media: Dict, original_ext: str) -> str:
+        """Format a filename for any identified media.
+        
+        Args:
+            media (Dict): Media information as returned by identify()
+            original_ext (str): The original file extension
+            
+        Returns:
+            str: Formatted filename
+        """
+        if media.get('media_type') == 'movie':
+            return self.format_movie_filename(media, original_ext)
+        if media.get('media_type') == 'anime':
+            name = media['title'].get('english') or media['title'].get('romaji') or 'Unknown'
+        else:
+            name = media.get('name', 'Unknown')
+        return f"{sanitize_filename(name)} - S01E01{original_ext}"
 
     def format_movie_filename(self, movie_info: Dict, original_ext: str) -> str:
         """Format a movie filename with standardized naming convention.
@@ -208,7 +496,7 @@ class MediaOrganizer:
         """
         title = movie_info.get('title', 'Unknown')
         year = movie_info.get('release_date', '0000')[:4]
-        safe_title = self.sanitize_filename(title)
+        safe_title = sanitize_filename(title)
         return f"{safe_title} ({year}){original_ext}"
 
     def download_artwork(self, url: str, save_path: Path):
@@ -219,9 +507,17 @@ class MediaOrganizer:
             save_path (Path): The path where the artwork should be saved
         """
         try:
-            res = requests.get(url, timeout=10)
-            res.raise_for_status()
-            save_path.write_bytes(res.content)
+            # Stream straight to disk instead of buffering the whole image in memory
+            with self.session.get(url, params={'api_key': None}, stream=True, timeout=10) as res:
+                res.raise_for_status()
+                try:
+                    with save_path.open('wb') as fh:
+                        for chunk in res.iter_content(chunk_size=64 * 1024):
+                            fh.write(chunk)
+                except Exception:
+                    # Don't leave a truncated image behind
+                    save_path.unlink(missing_ok=True)
+                    raise
             logger.info(f"Saved artwork: {save_path.name}")
         except Exception as e:
             logger.error(f"Artwork failed: {e}")
@@ -236,33 +532,43 @@ class MediaOrganizer:
         Returns:
             bool: True if successful, False otherwise
         """
-        try:
-            file_path = Path(file_path)
-            title, year = self.extract_title_year(file_path.name)
-            ext = file_path.suffix
+        title, year = extract_title_year(os.path.basename(file_path))
+        return self.rename_file(file_path, self.identify(title, year), dry_run)
+
+    def rename_file(self, file_path: Path, media: Optional[Dict], dry_run: bool = False) -> bool:
+        """Rename a media file using already-resolved metadata.
+        
+        Args:
+            file_path (Path): The path to the media file
+            media (Optional[Dict]): Media information as returned by identify(), or None if unmatched
+            dry_run (bool): If True, only print what would be done without actually renaming
             
-            # Search Logic
-            movie = self.search_movie(title, year)
-            if movie:
-                new_name = self.format_movie_filename(movie, ext)
-            else:
-                # Fallback or TV logic
-                tv = self.search_tv_show(title, year)
-                if tv:
-                    new_name = f"{self.sanitize_filename(tv['name'])} - S01E01{ext}"
-                else:
-                    logger.info(f"No match for {file_path.name}")
-                    return False
-
-            new_path = file_path.parent / new_name
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            # Plain string path ops avoid building intermediate Path objects per file
+            path_str = os.fspath(file_path)
+            parent, basename = os.path.split(path_str)
+            if not media:
+                logger.info(f"No match for {basename}")
+                return False
+            new_name = self.format_filename(media, os.path.splitext(basename)[1])
+
             if dry_run:
-                print(f"[DRY RUN] Rename: {file_path.name} -> {new_name}")
+                print(f"[DRY RUN] Rename: {basename} -> {new_name}")
                 return True
 
-            if not new_path.exists():
-                file_path.rename(new_path)
-                logger.info(f"Renamed: {new_name}")
-                return True
+            if new_name == basename:
+                return False
+
+            try:
+                rename_no_clobber(path_str, os.path.join(parent, new_name))
+            except FileExistsError:
+                logger.info(f"Target exists, skipping: {new_name}")
+                return False
+            logger.info(f"Renamed: {new_name}")
+            return True
         except Exception as e:
             logger.error(f"Error: {e}")
         return False
@@ -270,20 +576,44 @@ class MediaOrganizer:
     def process_directory(self, path: Path, dry_run: bool, recursive: bool):
         """Process all media files in a directory recursively.
         
+        Files are grouped by their extracted (title, year) first, so each unique
+        title is looked up once no matter how many episodes share it.
+        
         Args:
             path (Path): The directory to process
             dry_run (bool): If True, only print what would be done without actually renaming
             recursive (bool): If True, process subdirectories recursively
         """
-        exts = {'.mp4', '.mkv', '.avi', '.mov'}
-        files = []
-        pattern = "**/*" if recursive else "*"
-        for f in path.glob(pattern):
-            if f.is_file() and f.suffix.lower() in exts:
-                files.append(f)
-        
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            list(executor.map(lambda f: self.process_file(f, dry_run), files))
+        by_title: Dict[Tuple[str, Optional[int]], List[Path]] = defaultdict(list)
+        for f in iter_media_files(path, recursive):
+            by_title[extract_title_year(f.name)].append(f)
+        keys = list(by_title)
+        
+        def lookup(key):
+            try:
+                return self._lookup_multi(*key)
+            except Exception as e:
+                logger.error(f"Error searching for '{key[0]}': {e}")
+                return _LOOKUP_FAILED
+        
+        # One TMDB lookup per unique title
+        answers = dict(zip(keys, self._executor.map(lookup, keys)))
+        matches = {key: None if media is _LOOKUP_FAILED else media for key, media in answers.items()}
+        
+        # Only titles TMDB answered with no results are tried on AniList, in
+        # batched requests; failed lookups stay unmatched
+        missing = [key for key, media in answers.items() if media is None]
+        if missing:
+            anime = self.search_anime_batch([title for title, _ in missing])
+            for key in missing:
+                if anime.get(key[0]):
+                    matches[key] = {**anime[key[0]], 'media_type': 'anime'}
+        
+        # Apply each group's match to its files; no lookups happen here
+        jobs = [(f, matches[key]) for key, group in by_title.items() for f in group]
+        list(self._executor.map(lambda job: self.rename_file(job[0], job[1], dry_run), jobs))
+
+atexit.register(MediaOrganizer._executor.shutdown)
 
 def main():
     """Main entry point for the script."""
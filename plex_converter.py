@@ -15,9 +15,18 @@ Features:
 
 import os
 import sys
+import errno
 import argparse
-import re
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Windows-invalid characters: these are not allowed in Windows file names
+_INVALID_SET = frozenset('<>:"/\\|?*') | {chr(c) for c in range(32)}
+_TRANSLATE_REPL = {ord(c): '_' for c in _INVALID_SET}
+
+# Number of renames kept in flight at once; on network shares (SMB/NFS) each
+# rename is a round trip, so overlapping them hides most of the latency
+RENAME_WORKERS = 16
 
 
 def sanitize_filename(filename):
@@ -30,18 +39,17 @@ def sanitize_filename(filename):
     Returns:
         str: The sanitized filename
     """
-    # Remove or replace Windows-invalid characters
-    # These are characters that are not allowed in Windows file names
-    invalid_chars = r'[<>:"/\\|?*\x00-\x1F]'
+    # Fast path: already-clean names only need their ends trimmed
+    if _INVALID_SET.isdisjoint(filename) and '__' not in filename:
+        return filename.strip(' .').rstrip('_') or "unnamed_file"
     
-    # Replace invalid characters with underscore
-    sanitized = re.sub(invalid_chars, '_', filename)
-    
-    # Remove leading/trailing spaces and dots (Windows doesn't allow these)
-    sanitized = sanitized.strip(' .')
+    # Remove leading/trailing spaces and dots (Windows doesn't allow these),
+    # then replace invalid characters with underscore
+    sanitized = filename.strip(' .').translate(_TRANSLATE_REPL)
     
     # Replace multiple consecutive underscores with a single underscore
-    sanitized = re.sub(r'_+', '_', sanitized)
+    while '__' in sanitized:
+        sanitized = sanitized.replace('__', '_')
     
     # Remove trailing underscores
     sanitized = sanitized.rstrip('_')
@@ -53,38 +61,114 @@ def sanitize_filename(filename):
     return sanitized
 
 
-def process_file(file_path, dry_run=False):
+def iter_files(directory_path, recursive=True):
     """
-    Process a single file to make its name Plex-friendly.
+    Yield the files in a directory using os.scandir.
+    
+    Symlinked files are included; symlinked directories are not followed.
+    Subdirectories that cannot be read are reported and skipped.
+    
+    Args:
+        directory_path (Path): Path to the directory
+        recursive (bool): If True, descend into subdirectories
+        
+    Yields:
+        Path: Each file found
+    """
+    with os.scandir(directory_path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    try:
+                        yield from iter_files(entry.path, recursive)
+                    except PermissionError:
+                        print(f"Permission denied accessing directory: {entry.path}")
+            elif entry.is_file():
+                yield Path(entry.path)
+
+
+def rename_no_clobber(src, dst):
+    """
+    Rename a file without ever replacing an existing target.
+    
+    A hard link to the new name is created first, which fails atomically if
+    the target exists, and the old name is then removed. Plain os.rename on
+    POSIX would silently overwrite. Filesystems without hard links fall back
+    to a checked rename.
+    
+    Args:
+        src (str): The file to rename
+        dst (str): The new path
+        
+    Raises:
+        FileExistsError: If dst already exists
+    """
+    try:
+        os.link(src, dst, follow_symlinks=False)
+    except FileExistsError:
+        raise
+    except OSError:
+        # Hard links unsupported (FAT/exFAT, some SMB mounts)
+        if os.path.lexists(dst):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dst)
+        os.rename(src, dst)
+        return
+    os.unlink(src)
+
+
+def rename_file(file_path, sanitized_name, dry_run=False):
+    """
+    Rename a file in place to an already-sanitized name.
     
     Args:
         file_path (Path): Path to the file
+        sanitized_name (str): The new filename
         dry_run (bool): If True, only show what would be changed
         
     Returns:
-        bool: True if file was processed, False otherwise
+        bool: True if file was renamed (or would be), False on error
     """
-    original_name = file_path.name
-    sanitized_name = sanitize_filename(original_name)
-    
-    # If names are the same, no processing needed
-    if original_name == sanitized_name:
-        return False
+    # Plain string path ops avoid building intermediate Path objects per file
+    path_str = os.fspath(file_path)
+    parent, original_name = os.path.split(path_str)
     
     if dry_run:
         print(f"Would rename: {original_name} -> {sanitized_name}")
         return True
     
     try:
-        new_path = file_path.parent / sanitized_name
-        os.rename(file_path, new_path)
+        rename_no_clobber(path_str, os.path.join(parent, sanitized_name))
         print(f"Renamed: {original_name} -> {sanitized_name}")
         return True
+    except FileExistsError:
+        print(f"Target exists, skipping: {original_name} -> {sanitized_name}")
+        return False
     except OSError as e:
         print(f"Error renaming {original_name}: {e}")
         return False
 
 
+def process_file(file_path, dry_run=False):
+    """
+    Process a single file to make its name Plex-friendly.
+    
+    Args:
+        file_path (Path): Path to the file
+        dry_run (bool): If True, only show what would be changed
+        
+    Returns:
+        bool: True if file was processed, False otherwise
+    """
+    original_name = os.path.basename(file_path)
+    sanitized_name = sanitize_filename(original_name)
+    
+    # If names are the same, no processing needed
+    if original_name == sanitized_name:
+        return False
+    
+    return rename_file(file_path, sanitized_name, dry_run)
+
+
 def process_directory(directory_path, dry_run=False, recursive=True):
     """
     Process all files in a directory to make their names Plex-friendly.
@@ -99,22 +183,27 @@ def process_directory(directory_path, dry_run=False, recursive=True):
     """
     processed_count = 0
     error_count = 0
+    renames = []
+    targets = set()
     
     try:
-        # Get all files in the directory
-        if recursive:
-            # Process all files recursively
-            for file_path in directory_path.rglob('*'):
-                if file_path.is_file():
-                    if process_file(file_path, dry_run):
-                        processed_count += 1
-        else:
-            # Process only files in the specified directory (not subdirectories)
-            for file_path in directory_path.iterdir():
-                if file_path.is_file():
-                    if process_file(file_path, dry_run):
-                        processed_count += 1
-                        
+        # Work out every rename up front; sanitizing is CPU-bound, so it
+        # stays on this thread and only the renames go to the pool
+        for file_path in iter_files(directory_path, recursive):
+            parent, original_name = os.path.split(os.fspath(file_path))
+            sanitized_name = sanitize_filename(original_name)
+            if sanitized_name == original_name:
+                continue
+            # Two names can sanitize to the same target (a?.txt, a*.txt);
+            # only the first one found is renamed
+            target = os.path.join(parent, sanitized_name)
+            if target in targets:
+                print(f"Target already claimed, skipping: {original_name} -> {sanitized_name}")
+                error_count += 1
+                continue
+            targets.add(target)
+            renames.append((file_path, sanitized_name))
+                
     except PermissionError:
         print(f"Permission denied accessing directory: {directory_path}")
         error_count += 1
@@ -122,6 +211,16 @@ def process_directory(directory_path, dry_run=False, recursive=True):
         print(f"Error processing directory {directory_path}: {e}")
         error_count += 1
     
+    if dry_run:
+        results = [rename_file(path, name, dry_run) for path, name in renames]
+    else:
+        with ThreadPoolExecutor(max_workers=RENAME_WORKERS) as executor:
+            results = list(executor.map(lambda r: rename_file(*r), renames))
+    
+    # Renames that failed or hit an existing file count as errors
+    processed_count = sum(results)
+    error_count += len(results) - processed_count
+    
     return processed_count, error_count
 
 